@@ -0,0 +1,45 @@
+"""
+Small LRU cache for skipping repeated LLM-backed analyses.
+
+Test loops revisit the same pages with the same analysis requests over and
+over; when the page state is unchanged, the previous answer is still valid
+and the LLM round-trip can be skipped entirely.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ActionCache:
+    """LRU cache keyed by a caller-built hashable key (e.g. URL + request)."""
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for *key*, refreshing its recency."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store *value* under *key*, evicting the least recently used entry."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
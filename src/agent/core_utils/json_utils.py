@@ -0,0 +1,80 @@
+"""
+JSON helpers with optional orjson acceleration.
+
+orjson serializes/deserializes several times faster than the stdlib json
+module, but it is an optional dependency — every call site falls back to
+stdlib json transparently when orjson is not installed.
+"""
+
+import json as _stdlib_json
+import re as _re
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize *obj* to a JSON string (2-space indent when indent=True)."""
+    if _orjson is not None:
+        option = _orjson.OPT_INDENT_2 if indent else 0
+        return _orjson.dumps(obj, option=option).decode('utf-8')
+    if indent:
+        return _stdlib_json.dumps(obj, indent=2, ensure_ascii=False)
+    return _stdlib_json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def dumps_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes, skipping the str round-trip.
+
+    orjson produces bytes natively, so writers that open their file in
+    binary mode avoid an encode/decode pair per entry.
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_INDENT_2 if indent else 0
+        return _orjson.dumps(obj, option=option)
+    return dumps(obj, indent=indent).encode('utf-8')
+
+
+def loads(data):
+    """Deserialize a JSON string or bytes object."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return _stdlib_json.loads(data)
+
+
+def dump_stream(obj, fh, indent: bool = False):
+    """
+    Serialize *obj* into the open text file *fh*.
+
+    With orjson the encoded document is produced in one fast native pass;
+    otherwise the stdlib encoder's iterencode streams the output in chunks,
+    keeping peak memory bounded for large session dumps either way.
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_INDENT_2 if indent else 0
+        fh.write(_orjson.dumps(obj, option=option).decode('utf-8'))
+        return
+    if indent:
+        encoder = _stdlib_json.JSONEncoder(indent=2, ensure_ascii=False)
+    else:
+        encoder = _stdlib_json.JSONEncoder(separators=(',', ':'),
+                                           ensure_ascii=False)
+    for chunk in encoder.iterencode(obj):
+        fh.write(chunk)
+
+
+# Markdown code fence around a JSON document, as LLMs often emit despite
+# instructions; one compiled C-level scan replaces repeated str.find passes.
+# The json-tagged variant is tried first so a stray ``` or ```python block
+# earlier in the response cannot shadow the actual payload.
+_FENCE_JSON = _re.compile(r"```json\s*(.*?)\s*```", _re.DOTALL)
+_FENCE = _re.compile(r"```(?:json)?\s*(.*?)\s*```", _re.DOTALL)
+
+
+def extract_json(text: str):
+    """Parse a JSON document out of *text*, tolerating markdown fences."""
+    match = _FENCE_JSON.search(text) or _FENCE.search(text)
+    payload = match.group(1) if match else text.strip()
+    return loads(payload)
@@ -4,17 +4,30 @@ Supports any provider (openai, anthropic, gemini, openrouter, etc.)
 via a single interface.
 """
 
-import os
-import sys
+import asyncio
+import hashlib
+import threading
+from typing import Optional
+
+import httpx
 import litellm
 
-# Set up project root and add to sys.path
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-sys.path.insert(0, PROJECT_ROOT)
+from src.agent.core_utils.action_cache import ActionCache
 
 # Suppress litellm's verbose logging by default
 litellm.suppress_debug_info = True
 
+# Share one pooled HTTP session across all completions so TCP/TLS setup is
+# paid once per connection instead of per call
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16)
+if litellm.client_session is None:
+    litellm.client_session = httpx.Client(limits=_HTTP_LIMITS)
+if litellm.aclient_session is None:
+    litellm.aclient_session = httpx.AsyncClient(limits=_HTTP_LIMITS)
+
+# Delimiter used by ask_batch to split one completion into per-prompt answers
+_BATCH_SEPARATOR = "<<<SEP>>>"
+
 
 class LLMClient:
     """
@@ -36,20 +49,136 @@ class LLMClient:
         model: str = "gemini-2.0-flash",
         provider: str = "gemini",
         system_prompt: str = "You are a helpful assistant.",
+        temperature: Optional[float] = None,
     ):
         # LiteLLM model format: "provider/model" (e.g. "openai/gpt-5-mini")
         self.model = f"{provider}/{model}"
         self.system_prompt = system_prompt
+        self.temperature = temperature
+        # Exact-match response cache, enabled only at temperature 0 where
+        # identical prompts deterministically yield identical completions;
+        # a hit skips the network round-trip and the token spend entirely
+        if temperature == 0:
+            self._response_cache = ActionCache(capacity=1024)
+            self._cache_lock = threading.Lock()
+        else:
+            self._response_cache = None
 
-    def ask(self, user_prompt: str) -> str:
+    def _cache_key(self, user_prompt: str, system_prompt: str,
+                   json_mode: bool) -> bytes:
+        material = f"{self.model}\0{system_prompt}\0{user_prompt}\0{json_mode}"
+        return hashlib.blake2b(material.encode('utf-8'), digest_size=16).digest()
+
+    def ask(self, user_prompt: str, system_prompt: str = None,
+            json_mode: bool = False) -> str:
         """
         Sends a prompt to the model via LiteLLM and returns the response text.
+
+        A per-call system_prompt can be supplied so that a stable instruction
+        prefix stays in the system message — providers with prompt caching can
+        then skip re-prefilling it on every call. With json_mode=True the
+        provider is asked for a strict JSON document, avoiding markdown fences
+        and the parse-retry round trip they cause.
         """
+        system_text = system_prompt or self.system_prompt
+
+        key = None
+        if self._response_cache is not None:
+            key = self._cache_key(user_prompt, system_text, json_mode)
+            with self._cache_lock:
+                cached = self._response_cache.get(key)
+            if cached is not None:
+                return cached
+
+        kwargs = {}
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        if self.temperature is not None:
+            kwargs["temperature"] = self.temperature
         response = litellm.completion(
             model=self.model,
             messages=[
-                {"role": "system", "content": self.system_prompt},
+                {"role": "system", "content": system_text},
+                {"role": "user", "content": user_prompt},
+            ],
+            **kwargs,
+        )
+        text = response.choices[0].message.content
+
+        if key is not None:
+            with self._cache_lock:
+                self._response_cache.put(key, text)
+        return text
+
+    async def ask_async(self, user_prompt: str, system_prompt: str = None) -> str:
+        """
+        Async variant of ask() using LiteLLM's acompletion, so callers on an
+        event loop are not blocked for the duration of the HTTP round-trip.
+        """
+        response = await litellm.acompletion(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt or self.system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
         )
         return response.choices[0].message.content
+
+    def ask_stream(self, user_prompt: str, system_prompt: str = None):
+        """
+        Stream the response as an iterator of text chunks.
+
+        Lets callers start consuming (or abort on) the model output while
+        it is still being generated instead of waiting for the full
+        completion; ''.join(ask_stream(...)) is equivalent to ask(...).
+        """
+        response = litellm.completion(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt or self.system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            stream=True,
+        )
+        for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    async def ask_many(self, user_prompts: list) -> list:
+        """
+        Fan out independent prompts concurrently and return their responses
+        in order. N sequential round-trips collapse to roughly one.
+        """
+        return await asyncio.gather(*(self.ask_async(p) for p in user_prompts))
+
+    def ask_batch(self, user_prompts: list) -> list:
+        """
+        Marshal several independent prompts into a single completion and
+        split the answers back out, cutting N API calls down to one.
+
+        Falls back to one ask() per prompt if the model does not honor the
+        separator protocol, so callers always get len(user_prompts) answers.
+        """
+        if not user_prompts:
+            return []
+        if len(user_prompts) == 1:
+            return [self.ask(user_prompts[0])]
+
+        numbered = "\n\n".join(
+            f"### Prompt {i}\n{prompt}"
+            for i, prompt in enumerate(user_prompts, 1)
+        )
+        batch_prompt = (
+            f"Answer each of the {len(user_prompts)} prompts below independently.\n"
+            f"Output the answers in order, separated by a line containing exactly "
+            f"{_BATCH_SEPARATOR} (no other text on that line). Do not repeat the "
+            f"prompts or add commentary outside the answers.\n\n{numbered}"
+        )
+
+        response = self.ask(batch_prompt)
+        answers = [part.strip() for part in response.split(_BATCH_SEPARATOR)]
+        if len(answers) != len(user_prompts):
+            # Separator protocol broke down — retry prompts individually
+            return [self.ask(prompt) for prompt in user_prompts]
+        return answers
@@ -10,19 +10,62 @@ Ensures all debug logs are stored in a structured directory hierarchy:
       └── ...
 """
 
+import functools
 import os
-import sys
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 
-# Set up project root and add to sys.path
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-sys.path.insert(0, PROJECT_ROOT)
 
-# Configure logging
+# Library-safe logging: modules only get named loggers; handler/level
+# configuration is opt-in via configure_logging() from an entry point
 logger = logging.getLogger(__name__)
 
+
+def configure_logging(level: int = logging.INFO):
+    """
+    Configure root logging for CLI/application use.
+
+    Deliberately not called at import time so importing this project as a
+    library never mutates the root logger.
+    """
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+# Cache for fast_iso_timestamp(): the strftime of the current whole second
+_last_second = -1
+_last_second_text = ""
+
+
+def fast_iso_timestamp() -> str:
+    """
+    ISO-8601 timestamp for debug-log entries, cheaper than
+    datetime.now().isoformat().
+
+    The expensive strftime of the whole-second part is cached and reused
+    until the clock ticks over; only the microsecond suffix is formatted
+    per call. Output format matches isoformat() (microsecond precision).
+    """
+    global _last_second, _last_second_text
+    now = time.time()
+    second = int(now)
+    if second != _last_second:
+        _last_second_text = time.strftime("%Y-%m-%dT%H:%M:%S",
+                                          time.localtime(second))
+        _last_second = second
+    return f"{_last_second_text}.{int((now - second) * 1e6):06d}"
+
+
+@functools.lru_cache(maxsize=256)
+def safe_name(name: str) -> str:
+    """Convert a test case name to a filesystem-safe string (memoized)."""
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+
+
 class DebugLogger:
     """Centralized debug logging utility for consistent log file management."""
     
@@ -52,8 +95,8 @@ class DebugLogger:
 
         Layout:  logs/test_run_<ts>/<test_case_name>/
         """
-        safe_name = self._safe_name(test_case_name)
-        tc_dir = self._run_dir / safe_name
+        sanitized = safe_name(test_case_name)
+        tc_dir = self._run_dir / sanitized
         tc_dir.mkdir(exist_ok=True)
         return tc_dir
 
@@ -74,7 +117,7 @@ class DebugLogger:
         if debug_file_prefix:
             # Put it inside the test case subfolder
             directory = output_dir if output_dir is not None else self.get_test_case_dir(debug_file_prefix)
-            filename = f"{self._safe_name(debug_file_prefix)}_{component}_debug.log"
+            filename = f"{safe_name(debug_file_prefix)}_{component}_debug.log"
         else:
             directory = output_dir if output_dir is not None else self._run_dir
             filename = f"{component}_debug.log"
@@ -88,7 +131,7 @@ class DebugLogger:
         Layout:  logs/test_run_<ts>/<test_case_name>/<test_case_name>_analysis.json
         """
         tc_dir = self.get_test_case_dir(test_case_name)
-        filename = f"{self._safe_name(test_case_name)}_analysis.json"
+        filename = f"{safe_name(test_case_name)}_analysis.json"
         return str(tc_dir / filename)
 
     def get_session_log_path(self, filename: str = None,
@@ -114,7 +157,8 @@ class DebugLogger:
     def clean_old_logs(self, max_age_days: int = 7):
         """Clean up run directories older than *max_age_days*."""
         try:
-            import time
+            # shutil stays a lazy import: housekeeping is rare and this is
+            # the only user in the package
             import shutil
             current_time = time.time()
             max_age_seconds = max_age_days * 24 * 60 * 60
@@ -124,10 +168,10 @@ class DebugLogger:
                     age = current_time - entry.stat().st_mtime
                     if age > max_age_seconds:
                         shutil.rmtree(entry)
-                        logger.info(f"Cleaned up old run directory: {entry.name}")
+                        logger.info("Cleaned up old run directory: %s", entry.name)
 
         except Exception as e:
-            logger.error(f"Error cleaning up old logs: {e}")
+            logger.error("Error cleaning up old logs: %s", e)
 
     def get_logs_directory(self) -> Path:
         """Return the base logs directory."""
@@ -140,10 +184,9 @@ class DebugLogger:
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    @staticmethod
-    def _safe_name(name: str) -> str:
-        """Convert a test case name to a filesystem-safe string."""
-        return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+    # Kept as a class attribute for backward compatibility; the
+    # implementation lives at module level to skip descriptor binding
+    _safe_name = staticmethod(safe_name)
 
 
 # Global instance for use across the project
@@ -3,26 +3,85 @@ Simplified Memory System for Testing Agent
 Stores only essential information from LLM responses and tool outputs.
 """
 
-import json
 import os
+from collections import deque
+from itertools import islice
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from src.agent.core_utils import json_utils
+from src.agent.core_utils.logging_utils import fast_iso_timestamp
+
+# Banner string reused by the debug-log helper, built once at import
+_EQ80 = '=' * 80
+
+# Sentinel written over payload fields of entries older than the masking
+# window; the JSONL archive keeps the original text
+_MASKED = "<MASKED: observation too old>"
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cap *text* at *limit* characters, marking the cut with an ellipsis."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
 
 class EnhancedMemory:
     """
     Simplified memory system that stores only essential information:
-    - current_state from LLM responses 
+    - current_state from LLM responses
     - Essential tool execution outputs (message, findings, validation_passed)
+
+    Persistence is incremental: each save appends exactly one JSONL line
+    (O(1) per entry), never a re-dump of the whole history; the only full
+    serialization is the explicit end-of-session export_session_data().
     """
-    
-    def __init__(self, debug_file_path: Optional[str] = None):
+
+    def __init__(self, debug_file_path: Optional[str] = None, max_size: int = 100):
         """Initialize the simplified memory system."""
-        self.llm_states = []
-        self.tool_outputs = []
+        # Bounded ring buffers: deque(maxlen=...) evicts the oldest entry in
+        # O(1) on append, so long sessions never grow memory unbounded
+        self.max_size = max_size
+        self.llm_states = deque(maxlen=max_size)
+        self.tool_outputs = deque(maxlen=max_size)
         self.session_start_time = datetime.now()
         self.debug_file_path = debug_file_path
+        # Running success/failure tallies, maintained incrementally on save
+        # so get_execution_summary never has to rescan the ring buffers
+        self._successful_goals = 0
+        self._failed_goals = 0
+        self._successful_tools = 0
+        self._failed_tools = 0
+        # format_memory_context cache: the formatted text only changes when
+        # an entry is saved, so it is rebuilt at most once per save
+        self._version = 0
+        self._context_cache = None
+        self._context_cache_version = -1
+        self._patterns_cache = None
+        self._patterns_cache_version = -1
+        # One-line rollup of older history produced by condense(); stale
+        # entries behind it no longer need to ride along in every prompt
+        self._condensed_summary = None
+        self._condensed_version = -1
+        self._condensed_len = 0
+        # Append-only JSONL stream next to the debug log: each entry is
+        # written once as it arrives instead of rewriting the whole session
+        # file on every save
+        if debug_file_path:
+            self._jsonl_path = os.path.splitext(debug_file_path)[0] + "_memory.jsonl"
+        else:
+            self._jsonl_path = None
+        # Persistent buffered handle for the JSONL stream, opened lazily on
+        # first write; flushed every few entries rather than per entry
+        self._jsonl_fh = None
+        self._jsonl_pending = 0
+        # With no stream configured, rebind the append hook to a no-op so
+        # the disabled-logging save path pays nothing per entry
+        if not self._jsonl_path:
+            self._append_jsonl = self._append_jsonl_disabled
         
     def save_llm_response(self, llm_response: Dict[str, Any], 
                          step_number: int, browser_context: Dict[str, Any] = None):
@@ -39,13 +98,26 @@ class EnhancedMemory:
         if current_state:
             memory_entry = {
                 "step_number": step_number,
-                "current_state": current_state,
+                # Shallow-copy the payload container: _mask_old_entries later
+                # overwrites its "memory" field in place, and that must not
+                # reach the caller's dict (the agent keeps the same object in
+                # its execution log)
+                "current_state": dict(current_state),
                 "actions": actions,
                 "timestamp": datetime.now().isoformat()
             }
             
+            # Keep the aggregate counters in sync with the ring buffer:
+            # un-count the entry about to be evicted, count the new one
+            if len(self.llm_states) == self.llm_states.maxlen:
+                self._count_goal(self.llm_states[0], -1)
+            self._count_goal(memory_entry, 1)
+
             self.llm_states.append(memory_entry)
-        
+            self._version += 1
+            self._append_jsonl("llm_state", memory_entry)
+            self._mask_old_entries()
+
     def save_tool_output(self, tool_output: Dict[str, Any], 
                         step_number: int, browser_context: Dict[str, Any] = None,
                         request_reason: str = None):
@@ -72,109 +144,250 @@ class EnhancedMemory:
             "timestamp": datetime.now().isoformat()
         }
         
+        if len(self.tool_outputs) == self.tool_outputs.maxlen:
+            self._count_tool(self.tool_outputs[0], -1)
+        self._count_tool(memory_entry, 1)
+
         self.tool_outputs.append(memory_entry)
-        
+        self._version += 1
+        self._append_jsonl("tool_output", memory_entry)
+        self._mask_old_entries()
+
+    _MASK_WINDOW = 20
+    _RECONDENSE_BATCH = 5
+
+    def _mask_old_entries(self):
+        """
+        Replace bulky payload fields of entries beyond the recent window
+        with a sentinel (observation masking).
+
+        Step prompts never re-show observations this old, so keeping
+        their full text only inflates exports and session dumps; the
+        JSONL archive already holds each entry verbatim, and consumers
+        that walk the full buffers (the end-of-run analyzer) skip the
+        sentinel. Only memory-owned copies are masked — caller-held
+        dicts are copied at save time and stay intact.
+        """
+        for buffer, container_key, field in (
+            (self.llm_states, "current_state", "memory"),
+            (self.tool_outputs, "tool_output", "findings"),
+        ):
+            cutoff = len(buffer) - self._MASK_WINDOW
+            # Walk the prefix newest-first: the first already-masked entry
+            # means everything older is masked too, so each save masks at
+            # most the one entry that just left the window
+            for i in range(cutoff - 1, -1, -1):
+                payload = buffer[i][container_key]
+                if payload.get(field) in (None, "", _MASKED):
+                    break
+                payload[field] = _MASKED
+
+    def _count_goal(self, entry: Dict[str, Any], delta: int):
+        """Adjust the goal success/failure tallies for one llm_state entry."""
+        evaluation = entry["current_state"].get("evaluation_previous_goal", "").lower()
+        if "success" in evaluation:
+            self._successful_goals += delta
+        elif "failed" in evaluation:
+            self._failed_goals += delta
+
+    def _count_tool(self, entry: Dict[str, Any], delta: int):
+        """Adjust the tool success/failure tallies for one tool_output entry."""
+        validation_passed = entry["tool_output"].get("validation_passed")
+        if validation_passed is True:
+            self._successful_tools += delta
+        elif validation_passed is False:
+            self._failed_tools += delta
+
+    _JSONL_FLUSH_EVERY = 32
+
+    def _append_jsonl_disabled(self, entry_type: str, entry: Dict[str, Any]):
+        """No-op bound over _append_jsonl when no JSONL stream is configured."""
+
+    def _append_jsonl(self, entry_type: str, entry: Dict[str, Any]):
+        """Append a single memory entry to the JSONL stream."""
+        try:
+            # Binary append through one buffered handle: orjson emits bytes
+            # natively and the open/close syscall pair per entry is gone
+            if self._jsonl_fh is None:
+                self._jsonl_fh = open(self._jsonl_path, 'ab', buffering=1 << 16)
+            self._jsonl_fh.write(
+                json_utils.dumps_bytes({"type": entry_type, **entry}) + b"\n")
+            self._jsonl_pending += 1
+            if self._jsonl_pending >= self._JSONL_FLUSH_EVERY:
+                self._jsonl_fh.flush()
+                self._jsonl_pending = 0
+        except Exception:
+            # Silent fail for logging - don't break main execution
+            pass
+
+    def close(self):
+        """Flush and close the JSONL stream handle if one is open."""
+        if self._jsonl_fh is not None:
+            try:
+                self._jsonl_fh.close()
+            except Exception:
+                pass
+            self._jsonl_fh = None
+            self._jsonl_pending = 0
+
+    def __del__(self):
+        self.close()
+
     def get_recent_llm_states(self, count: int = 5) -> List[Dict[str, Any]]:
         """Get recent LLM current_state entries."""
-        recent_states = self.llm_states[-count:] if len(self.llm_states) > count else self.llm_states
-        return recent_states
-        
+        start = max(0, len(self.llm_states) - count)
+        return list(islice(self.llm_states, start, None))
+
     def get_recent_tool_outputs(self, count: int = 3) -> List[Dict[str, Any]]:
         """Get recent tool outputs."""
-        recent_tools = self.tool_outputs[-count:] if len(self.tool_outputs) > count else self.tool_outputs
-        return recent_tools
+        start = max(0, len(self.tool_outputs) - count)
+        return list(islice(self.tool_outputs, start, None))
         
     def get_execution_summary(self) -> Dict[str, Any]:
         """Get simplified execution summary."""
-        total_llm_states = len(self.llm_states)
-        total_tool_executions = len(self.tool_outputs)
-        
-        # Analyze success patterns from LLM states
-        successful_goals = 0
-        failed_goals = 0
-        
-        for state in self.llm_states:
-            if "current_state" in state:
-                evaluation = state["current_state"].get("evaluation_previous_goal", "").lower()
-                if "success" in evaluation:
-                    successful_goals += 1
-                elif "failed" in evaluation:
-                    failed_goals += 1
-        
-        # Analyze tool success patterns
-        successful_tools = 0
-        failed_tools = 0
-        
-        for tool in self.tool_outputs:
-            if "tool_output" in tool:
-                validation_passed = tool["tool_output"].get("validation_passed")
-                if validation_passed is True:
-                    successful_tools += 1
-                elif validation_passed is False:
-                    failed_tools += 1
-        
+        # Success patterns are tallied incrementally at save time
+        successful_goals = self._successful_goals
+        failed_goals = self._failed_goals
+        successful_tools = self._successful_tools
+        failed_tools = self._failed_tools
+
         return {
             "session_duration": (datetime.now() - self.session_start_time).total_seconds(),
-            "total_llm_states": total_llm_states,
-            "total_tool_executions": total_tool_executions,
+            "total_llm_states": len(self.llm_states),
+            "total_tool_executions": len(self.tool_outputs),
             "goal_success_rate": successful_goals / max(successful_goals + failed_goals, 1),
             "tool_success_rate": successful_tools / max(successful_tools + failed_tools, 1),
             "recent_memory_pattern": self._analyze_recent_patterns()
         }
         
     def _analyze_recent_patterns(self) -> Dict[str, Any]:
-        """Analyze recent execution patterns for insights."""
+        """Analyze recent execution patterns for insights (cached per version)."""
+        # Reuse the last result until a save bumps the version counter —
+        # get_execution_summary can be called repeatedly between saves
+        if self._patterns_cache_version == self._version:
+            return self._patterns_cache
+
+        patterns = self._build_recent_patterns()
+        self._patterns_cache = patterns
+        self._patterns_cache_version = self._version
+        return patterns
+
+    def _build_recent_patterns(self) -> Dict[str, Any]:
+        """Compute the recent-pattern analysis from the ring buffers."""
         recent_states = self.get_recent_llm_states(3)
         recent_tools = self.get_recent_tool_outputs(2)
         
-        patterns = {
-            "recent_goal_evaluations": [
-                state["current_state"].get("evaluation_previous_goal", "Unknown")
-                for state in recent_states
-            ],
-            "recent_next_goals": [
-                state["current_state"].get("next_goal", "Unknown")
-                for state in recent_states
-            ],
+        # Single pass over the states: both fields come from the same
+        # current_state dict, so fetch it once per entry
+        goal_evaluations = []
+        next_goals = []
+        for state in recent_states:
+            current_state = state["current_state"]
+            goal_evaluations.append(
+                current_state.get("evaluation_previous_goal", "Unknown"))
+            next_goals.append(current_state.get("next_goal", "Unknown"))
+
+        return {
+            "recent_goal_evaluations": goal_evaluations,
+            "recent_next_goals": next_goals,
             "recent_tool_validations": [
                 tool["tool_output"].get("validation_passed", None)
                 for tool in recent_tools
             ]
         }
         
-        return patterns
-        
+    def condense(self, llm_client, keep_recent: int = 10) -> bool:
+        """
+        Roll older history up into a short LLM-written summary.
+
+        When the session has accumulated more than *keep_recent* LLM states,
+        everything before the recent tail is summarized once and cached; the
+        summary is reused (no further LLM calls) until _RECONDENSE_BATCH new
+        entries accumulate, so calling this every step costs nothing most of
+        the time. Returns True if a new summary was produced.
+        """
+        if len(self.llm_states) <= keep_recent:
+            return False
+        # Skip if nothing was saved since the last condensation
+        if self._condensed_version == self._version:
+            return False
+        # Re-summarize in batches: one LLM call per _RECONDENSE_BATCH new
+        # entries, not one per save
+        if (self._condensed_summary is not None
+                and len(self.llm_states) - self._condensed_len < self._RECONDENSE_BATCH):
+            return False
+
+        older = list(islice(self.llm_states, 0,
+                            len(self.llm_states) - keep_recent))
+        lines = [
+            f"Step {state['step_number']}: "
+            f"{state['current_state'].get('evaluation_previous_goal', 'Unknown')} -> "
+            f"{state['current_state'].get('next_goal', 'Unknown')}"
+            for state in older
+        ]
+        prompt = (
+            "Summarize the following browser-automation steps in at most "
+            "three sentences, keeping goals reached and failures:\n"
+            + "\n".join(lines)
+        )
+        try:
+            self._condensed_summary = llm_client.ask(prompt).strip()
+            self._condensed_version = self._version
+            self._condensed_len = len(self.llm_states)
+            # The rendered context embeds the summary, so force a rebuild
+            self._context_cache_version = -1
+            return True
+        except Exception:
+            # Condensation is an optimization — never break the session
+            return False
+
     def format_memory_context(self) -> str:
         """Format simplified memory context for LLM prompts."""
+        if self._context_cache_version == self._version:
+            return self._context_cache
+
+        result = self._build_memory_context()
+        self._context_cache = result
+        self._context_cache_version = self._version
+        return result
+
+    def _build_memory_context(self) -> str:
+        """Render the memory context text from the ring buffers."""
         if not self.llm_states and not self.tool_outputs:
             return "No previous actions executed in this session."
         
         context_lines = []
-        
-        # Add recent LLM states
+
+        if self._condensed_summary:
+            context_lines.append(f"Session Summary (older steps): {self._condensed_summary}")
+            context_lines.append("")
+
+        # Add recent LLM states — one pre-joined chunk per entry
         recent_states = self.get_recent_llm_states(3)
         if recent_states:
             context_lines.append("Recent LLM States:")
-            for state in recent_states:
-                current_state = state["current_state"]
-                context_lines.append(f"  Step {state['step_number']}:")
-                context_lines.append(f"    Evaluation: {current_state.get('evaluation_previous_goal', 'Unknown')}")
-                context_lines.append(f"    Memory: {current_state.get('memory', 'No memory')[:500]}...")
-                context_lines.append(f"    Next Goal: {current_state.get('next_goal', 'Unknown')}")
+            context_lines.extend(
+                f"  Step {state['step_number']}:\n"
+                f"    Evaluation: {state['current_state'].get('evaluation_previous_goal', 'Unknown')}\n"
+                f"    Memory: {_truncate(state['current_state'].get('memory', 'No memory'), 500)}\n"
+                f"    Next Goal: {state['current_state'].get('next_goal', 'Unknown')}"
+                for state in recent_states
+            )
             context_lines.append("")
-        
+
         # Add recent tool outputs
         recent_tools = self.get_recent_tool_outputs(2)
         if recent_tools:
             context_lines.append("Recent Tool Outputs:")
-            for tool in recent_tools:
-                tool_output = tool["tool_output"]
-                context_lines.append(f"  Step {tool['step_number']} Tool:")
-                context_lines.append(f"    Request: {tool_output.get('request_reason', 'No reason provided')}")
-                if tool_output.get('findings'):
-                    context_lines.append(f"    Findings: {tool_output['findings'][:1000]}...")
+            context_lines.extend(
+                f"  Step {tool['step_number']} Tool:\n"
+                f"    Request: {tool['tool_output'].get('request_reason', 'No reason provided')}"
+                + (f"\n    Findings: {_truncate(tool['tool_output']['findings'], 1000)}"
+                   if tool['tool_output'].get('findings') else "")
+                for tool in recent_tools
+            )
             context_lines.append("")
-        
+
         return "\n".join(context_lines)
         
     def _log_to_debug_file(self, event_type: str, data: Dict[str, Any]):
@@ -185,16 +398,16 @@ class EnhancedMemory:
         try:
             log_entry = {
                 "event_type": f"MEMORY_{event_type.upper()}",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": fast_iso_timestamp(),
                 "data": data
             }
             
             with open(self.debug_file_path, 'a', encoding='utf-8') as f:
-                f.write(f"\n{'='*80}\n")
+                f.write(f"\n{_EQ80}\n")
                 f.write(f"MEMORY EVENT: {event_type}\n")
                 f.write(f"TIMESTAMP: {log_entry['timestamp']}\n")
-                f.write(f"{'='*80}\n\n")
-                f.write(json.dumps(data, indent=2, ensure_ascii=False))
+                f.write(f"{_EQ80}\n\n")
+                f.write(json_utils.dumps(data, indent=True))
                 f.write(f"\n\n")
                 
         except Exception as e:
@@ -203,17 +416,24 @@ class EnhancedMemory:
             
     def export_session_data(self, file_path: str):
         """Export simplified session data to JSON file."""
+        # Make sure buffered JSONL output is on disk alongside the export
+        if self._jsonl_fh is not None:
+            try:
+                self._jsonl_fh.flush()
+            except Exception:
+                pass
+        export_time = datetime.now()
         session_data = {
             "session_info": {
                 "start_time": self.session_start_time.isoformat(),
-                "export_time": datetime.now().isoformat(),
-                "duration": (datetime.now() - self.session_start_time).total_seconds()
+                "export_time": export_time.isoformat(),
+                "duration": (export_time - self.session_start_time).total_seconds()
             },
-            "llm_states": self.llm_states,
-            "tool_outputs": self.tool_outputs,
+            "llm_states": list(self.llm_states),
+            "tool_outputs": list(self.tool_outputs),
             "execution_summary": self.get_execution_summary()
         }
         
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(session_data, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+            json_utils.dump_stream(session_data, f, indent=True)
\ No newline at end of file
@@ -3,11 +3,10 @@ Simple Test Result Analyzer for Testing Agent
 """
 
 import json
-import os
-from datetime import datetime
 from typing import Dict, Any
+from src.agent.core_utils import json_utils
 from src.agent.core_utils.llm import LLMClient
-from src.agent.core_utils.memory import EnhancedMemory
+from src.agent.core_utils.memory import EnhancedMemory, _MASKED
 from src.agent.core_utils.logging_utils import debug_logger
 
 class TestResultAnalyzer:
@@ -36,25 +35,12 @@ class TestResultAnalyzer:
             # Get LLM analysis
             llm_response = self.llm.ask(analysis_prompt)
             
-            # Try to parse as JSON, handle markdown code blocks
+            # Parse as JSON, tolerating markdown fences; fall back to the
+            # raw text when the response is not JSON at all
             try:
-                # First try direct JSON parsing
-                analysis = json.loads(llm_response)
-            except json.JSONDecodeError:
-                try:
-                    # Try to extract JSON from markdown code blocks
-                    if "```json" in llm_response:
-                        # Extract content between ```json and ```
-                        start = llm_response.find("```json") + 7
-                        end = llm_response.find("```", start)
-                        json_content = llm_response[start:end].strip()
-                        analysis = json.loads(json_content)
-                    else:
-                        # Fallback to text response
-                        analysis = {"summary": llm_response}
-                except json.JSONDecodeError:
-                    # Final fallback
-                    analysis = {"summary": llm_response}
+                analysis = json_utils.extract_json(llm_response)
+            except (ValueError, TypeError):
+                analysis = {"summary": llm_response}
             
             # Prepare complete result
             result = {
@@ -92,8 +78,10 @@ class TestResultAnalyzer:
     
     def _create_analysis_prompt(self, test_goal: str, expected_outcome: str, memory: EnhancedMemory) -> str:
         """Create comprehensive analysis prompt from memory data."""
-        
-        prompt = f"""
+
+        # Collect parts in a list and join once — repeated += on a growing
+        # string re-copies the whole prompt for every appended line
+        parts = [f"""
 You are analyzing a test execution. Be concise and direct.
 
 ORIGINAL TEST GOAL:
@@ -103,36 +91,43 @@ ORIGINAL EXPECTED OUTCOME:
 {expected_outcome}
 
 EXECUTION FLOW:
-"""
-        
+"""]
+
         # Add LLM states progression
         for state in memory.llm_states:
             step_num = state.get("step_number")
             current_state = state.get("current_state", {})
-            
-            prompt += f"\nStep {step_num}:\n"
-            prompt += f"  Goal: {current_state.get('next_goal', 'N/A')}\n"
-            prompt += f"  Evaluation of previous: {current_state.get('evaluation_previous_goal', 'N/A')}\n"
-            prompt += f"  Memory: {current_state.get('memory', 'N/A')}\n"
-        
-        # Add expected outcome in the middle of execution flow
-        prompt += f"""
 
-"""
-        
+            parts.append(
+                f"\nStep {step_num}:\n"
+                f"  Goal: {current_state.get('next_goal', 'N/A')}\n"
+                f"  Evaluation of previous: {current_state.get('evaluation_previous_goal', 'N/A')}\n"
+            )
+            # Old entries carry the masking sentinel instead of their memory
+            # text; leave the line out rather than feed noise to the analyzer
+            mem_text = current_state.get('memory', 'N/A')
+            if mem_text != _MASKED:
+                parts.append(f"  Memory: {mem_text}\n")
+
+        parts.append("\n\n")
+
         # Add tool validation results
         if memory.tool_outputs:
-            prompt += "\nTOOL VALIDATIONS:\n"
+            parts.append("\nTOOL VALIDATIONS:\n")
             for output in memory.tool_outputs:
                 step_num = output.get("step_number")
                 tool_data = output.get("tool_output", {})
-                
-                prompt += f"\nStep {step_num} Tool Result:\n"
-                prompt += f"  Validation Passed: {tool_data.get('validation_passed')}\n"
-                prompt += f"  Findings: {tool_data.get('findings', 'N/A')}\n"
-                prompt += f"  Reason: {tool_data.get('request_reason', 'N/A')}\n"
-        
-        prompt += """
+
+                parts.append(
+                    f"\nStep {step_num} Tool Result:\n"
+                    f"  Validation Passed: {tool_data.get('validation_passed')}\n"
+                    f"  Reason: {tool_data.get('request_reason', 'N/A')}\n"
+                )
+                findings = tool_data.get('findings', 'N/A')
+                if findings != _MASKED:
+                    parts.append(f"  Findings: {findings}\n")
+
+        parts.append("""
 
 Please analyze this and respond in JSON format:
 
@@ -144,6 +139,6 @@ Please analyze this and respond in JSON format:
 }
 
 Give detailed explanation. Focus on whether the test goal was achieved.
-"""
-        
-        return prompt
+""")
+
+        return "".join(parts)
@@ -1,18 +1,93 @@
 import json
-import os
-import sys
-import ast
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-sys.path.insert(0, PROJECT_ROOT)
+from collections import deque
+from dataclasses import dataclass, asdict
 from src.agent.core_utils.llm import LLMClient
+from src.agent.core_utils import json_utils
 from src.agent.main_agent.prompt_generator import SystemPromptBase
-from src.agent.core_utils.logging_utils import debug_logger
+from src.agent.core_utils.logging_utils import debug_logger, fast_iso_timestamp
 from src.agent.core_utils.memory import EnhancedMemory
 from typing import Dict, List, Any
 from datetime import datetime
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 # Configure logging
 
+# Banner strings reused by _log_debug, built once at import
+_EQ80 = '=' * 80
+_DASH40 = '-' * 40
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cap *text* at *limit* characters, marking the cut with an ellipsis."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+# Shape of a valid LLM action response, used to code-generate a single
+# straight-line validator with fastjsonschema when it is installed
+_ACTION_RESPONSE_SCHEMA = {
+    "type": "object",
+    "required": ["current_state", "action"],
+    "properties": {
+        "current_state": {
+            "type": "object",
+            "required": ["evaluation_previous_goal", "memory", "next_goal"],
+        },
+        "action": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "minProperties": 1,
+                "maxProperties": 1,
+            },
+        },
+    },
+}
+
+if fastjsonschema is not None:
+    _validate_action_schema = fastjsonschema.compile(_ACTION_RESPONSE_SCHEMA)
+else:
+    _validate_action_schema = None
+
+@dataclass(slots=True)
+class Step:
+    """One executed step; slots keep long step histories compact."""
+    step_number: int
+    action: Dict[str, Any]
+    result: str
+    success: bool
+    url: str
+    timestamp: str
+    session_time: float
+
+
+# Static skeleton of the per-step context prompt, templated once at import
+# time; build_context_prompt just fills in the dynamic blocks
+_CONTEXT_TEMPLATE = """
+# Current Task
+{goal}
+
+# Previous Steps
+{previous_steps}
+
+# Current Browser State
+{browser_state}
+
+# Memory Context
+{memory_context}
+
+# Available Actions
+{valid_actions}
+
+Please provide your next action(s) in the required JSON format.
+"""
+
 
 class Agent:
     """
@@ -22,13 +97,34 @@ class Agent:
         self.llm = llm
         self.max_actions = max_actions
         self.debug = debug
-        self.previous_steps = []
+        # Bounded window of recent steps plus running totals, so summaries
+        # and the step budget never rescan or grow with session length
+        self.previous_steps = deque(maxlen=max_actions)
+        self._total_steps = 0
+        self._successful_steps = 0
+        self._failed_steps = 0
         self.current_url = ""
         self.open_tabs = []
         self.interactive_elements = ""
         self.valid_actions = "No browser controller attached. Available actions will be populated when browser controller is set."
         self.system_prompt = SystemPromptBase(max_actions_per_step=max_actions)
+        # The rendered system prompt is static for the agent's lifetime, so
+        # template it once instead of on every context build
+        self._system_prompt_text = self.system_prompt.get_prompt()
         self.browser_controller = None
+        # Handler table for execute_action, built once so dispatch is a
+        # single dict lookup instead of a 9-branch string comparison chain
+        self._action_handlers = {
+            "navigate_to":   self._do_navigate_to,
+            "click_element": self._do_click_element,
+            "input_text":    self._do_input_text,
+            "switch_tab":    self._do_switch_tab,
+            "open_tab":      self._do_open_tab,
+            "close_tab":     self._do_close_tab,
+            "go_back":       self._do_go_back,
+            "tools":         self._do_tools,
+            "end":           self._do_end,
+        }
         self.recent_alerts = []
         self.session_start_time = datetime.now()
         
@@ -38,9 +134,40 @@ class Agent:
         else:
             self.debug_file = None
             
+        # Persistent buffered handle for the debug log, opened lazily so a
+        # debug_file assigned after construction is picked up transparently
+        self._debug_fh = None
+        self._debug_fh_path = None
+
+        # Per-section prompt caches: only sections whose inputs changed are
+        # re-rendered when the context prompt is rebuilt each step
+        self._browser_state_dirty = True
+        self._browser_state_cache = ""
+        self._prev_steps_cache = "No previous steps in this session."
+        self._prev_steps_cache_version = 0
+
         # Initialize enhanced memory system with debug file path
         self.memory = EnhancedMemory(debug_file_path=self.debug_file)
-        
+
+    def _get_debug_fh(self):
+        """Return the open debug-log handle, (re)opening it if the path changed."""
+        if self._debug_fh is None or self._debug_fh_path != self.debug_file:
+            self._close_debug_fh()
+            self._debug_fh = open(self.debug_file, 'a', buffering=1 << 16,
+                                  encoding='utf-8')
+            self._debug_fh_path = self.debug_file
+        return self._debug_fh
+
+    def _close_debug_fh(self):
+        """Flush and close the debug-log handle if one is open."""
+        if self._debug_fh is not None:
+            try:
+                self._debug_fh.close()
+            except Exception:
+                pass
+            self._debug_fh = None
+            self._debug_fh_path = None
+
     def enable_debug_mode(self, debug_file_prefix: str = None):
         """Enable debug mode for agent."""
         self.debug = True
@@ -60,6 +187,7 @@ class Agent:
         """Disable debug mode for agent."""
         self.debug = False
         self.debug_file = None
+        self._close_debug_fh()
         
         # Clear browser controller logging functions if available
         if self.browser_controller and hasattr(self.browser_controller, 'set_logging_functions'):
@@ -98,93 +226,96 @@ class Agent:
             self.interactive_elements = elements
         if actions is not None:
             self.valid_actions = actions
-            
+        self._browser_state_dirty = True
+
         
     def add_step(self, action: Dict[str, Any], result: Any, success: bool = True):
         """Add a completed step to the previous steps list."""
-        step = {
-            "step_number": len(self.previous_steps) + 1,
-            "action": action,
-            "result": str(result),
-            "success": success,
-            "url": self.current_url,
-            "timestamp": datetime.now().isoformat(),
-            "session_time": (datetime.now() - self.session_start_time).total_seconds()
-        }
-        
+        now = datetime.now()
+        step = Step(
+            step_number=self._total_steps + 1,
+            action=action,
+            result=str(result),
+            success=success,
+            url=self.current_url,
+            timestamp=now.isoformat(),
+            session_time=(now - self.session_start_time).total_seconds(),
+        )
+
         self.previous_steps.append(step)
+        self._total_steps += 1
+        if success:
+            self._successful_steps += 1
+        else:
+            self._failed_steps += 1
         
     def build_context_prompt(self, user_goal: str) -> str:
-        """Build the complete context prompt for the LLM."""
-        # Get system prompt
-        system_prompt = self.system_prompt.get_prompt()
-        
-        # Get recent memory context
-        memory_context = self._format_memory_context()
-        
-        # Format previous steps
-        previous_steps_text = self._format_previous_steps()
-        
-        # Format current browser state
-        browser_state = self._format_browser_state()
-        
-        # Build the complete prompt
-        context_prompt = f"""
-{system_prompt}
-
-# Current Task
-{user_goal}
-
-# Previous Steps
-{previous_steps_text}
-
-# Current Browser State
-{browser_state}
-
-# Memory Context
-{memory_context}
-
-# Available Actions
-{self.valid_actions}
+        """
+        Build the dynamic context prompt for the LLM.
 
-Please provide your next action(s) in the required JSON format.
-"""
-        
-        return context_prompt
+        The static system prompt is not included here — it is sent as the
+        system message (see get_next_action), keeping the per-step user
+        prompt small and the cacheable prefix byte-identical across steps.
+        """
+        return _CONTEXT_TEMPLATE.format(
+            goal=user_goal,
+            previous_steps=self._format_previous_steps(),
+            browser_state=self._format_browser_state(),
+            memory_context=self._format_memory_context(),
+            valid_actions=self.valid_actions,
+        )
         
     def _format_memory_context(self) -> str:
         """Format memory context using the enhanced memory system."""
         return self.memory.format_memory_context()
         
     def _format_previous_steps(self) -> str:
-        """Format previous steps for the prompt."""
+        """Format previous steps for the prompt (cached until a step is added)."""
+        if self._prev_steps_cache_version == self._total_steps:
+            return self._prev_steps_cache
+
+        result = self._build_previous_steps()
+        self._prev_steps_cache = result
+        self._prev_steps_cache_version = self._total_steps
+        return result
+
+    def _build_previous_steps(self) -> str:
+        """Render the previous-steps section from the step window."""
         if not self.previous_steps:
             return "No previous steps in this session."
-            
+
         formatted_steps = []
-        for step in self.previous_steps[-3:]:  # Show last 3 steps
+        for step in list(self.previous_steps)[-3:]:  # Show last 3 steps
             # Extract action name from the action dictionary
-            if isinstance(step["action"], dict):
+            if isinstance(step.action, dict):
                 # Get the first (and should be only) key from the action dict
-                action_name = list(step["action"].keys())[0] if step["action"] else "unknown"
+                action_name = next(iter(step.action)) if step.action else "unknown"
             else:
-                action_name = str(step["action"])
-            
-            status = "✓" if step["success"] else "✗"
+                action_name = str(step.action)
+
+            status = "✓" if step.success else "✗"
             # Truncate result to 100 characters since memory system handles full details
-            result_text = str(step['result'])
-            if len(result_text) > 100:
-                result_text = result_text[:100] + "..."
-            
+            result_text = _truncate(step.result, 100)
+
             formatted_steps.append(
-                f"{status} Step {step['step_number']}: {action_name} "
+                f"{status} Step {step.step_number}: {action_name} "
                 f"(Result: {result_text})"
             )
             
         return "\n".join(formatted_steps)
         
     def _format_browser_state(self) -> str:
-        """Format current browser state for the prompt."""
+        """Format current browser state for the prompt (cached until it changes)."""
+        if not self._browser_state_dirty:
+            return self._browser_state_cache
+
+        result = self._build_browser_state()
+        self._browser_state_cache = result
+        self._browser_state_dirty = False
+        return result
+
+    def _build_browser_state(self) -> str:
+        """Render the browser-state section from the current attributes."""
         tabs_text = f"{len(self.open_tabs)} tabs open" if self.open_tabs else "No tabs"
 
         # Include any recent browser alerts/dialogs
@@ -204,7 +335,7 @@ Interactive Elements:
         Get the next action to perform based on current state and user goal.
         Returns a JSON response with the action(s) to take.
         """
-        if len(self.previous_steps) >= self.max_actions:
+        if self._total_steps >= self.max_actions:
             return {
                 "current_state": {
                     "evaluation_previous_goal": "Failed",
@@ -214,26 +345,36 @@ Interactive Elements:
                 "action": [{"stop": {"reason": f"Maximum actions ({self.max_actions}) reached"}}]            }
             
         try:
+            # Roll older history into a short summary before building the
+            # prompt so long sessions keep a bounded context; a no-op until
+            # the recent tail overflows, then one LLM call per batch of new
+            # entries
+            self.memory.condense(self.llm)
+
             # Build context for LLM
             context = self.build_context_prompt(user_goal)
             
-            # Get response from LLM
-            response = self.llm.ask(context)
+            # Get response from LLM — the static system prompt goes in the
+            # system message so providers can reuse its cached prefix, and
+            # json_mode asks for a strict JSON document up front
+            response = self.llm.ask(
+                context,
+                system_prompt=self._system_prompt_text,
+                json_mode=True,
+            )
             
             # Log debug information if enabled
-            self._log_debug(context, response, len(self.previous_steps) + 1)
+            self._log_debug(context, response, self._total_steps + 1)
             
-            # Parse JSON response
+            # Parse JSON response (orjson-backed when available;
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError so the
+            # except clauses below are unchanged)
             try:
-                action_data = json.loads(response)
+                action_data = json_utils.loads(response)
             except json.JSONDecodeError:
-                # Try to extract JSON from response if it's wrapped in text
-                response = response.strip()
-                if response.startswith("```json"):
-                    response = response[7:]
-                if response.endswith("```"):
-                    response = response[:-3]
-                action_data = json.loads(response.strip())
+                # Try to extract JSON from response if it's wrapped in
+                # markdown fences or surrounding text
+                action_data = json_utils.extract_json(response)
             
             # Validate response format
             if not self._validate_action_response(action_data):
@@ -249,7 +390,7 @@ Interactive Elements:
             # Save LLM response to memory
             self.memory.save_llm_response(
                 llm_response=action_data,
-                step_number=len(self.previous_steps) + 1
+                step_number=self._total_steps + 1
             )
                 
             return action_data
@@ -277,6 +418,14 @@ Interactive Elements:
             
     def _validate_action_response(self, action_data: Dict) -> bool:
         """Validate that the action response has required fields and structure."""
+        if _validate_action_schema is not None:
+            try:
+                _validate_action_schema(action_data)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+
+        # Hand-rolled fallback when fastjsonschema is not installed
         if not isinstance(action_data, dict):
             return False
             
@@ -308,97 +457,103 @@ Interactive Elements:
             return {"success": False, "error": "No browser controller available"}
             
         # Extract action name and parameters
-        action_name = list(action_item.keys())[0]
+        action_name = next(iter(action_item))
         action_params = action_item[action_name]
-        
-        
+
+        handler = self._action_handlers.get(action_name)
+        if handler is None:
+            return {"success": False, "error": f"Unknown action: {action_name}"}
+
         try:
-            if action_name == "navigate_to":
-                url = action_params.get("url")
-                if not url:
-                    return {"success": False, "error": "No URL provided for navigation"}
-                result = self.browser_controller.execute_command("navigate_to", url)
-                return {"success": result, "message": f"Navigated to {url}"}
-                
-            elif action_name == "click_element":
-                index = action_params.get("index")
-                if index is None:
-                    return {"success": False, "error": "No element index provided"}
-                result = self.browser_controller.execute_command("click_element", index)
-                return {"success": result, "message": f"Clicked element at index {index}"}
-                
-            elif action_name == "input_text":
-                index = action_params.get("index")
-                text = action_params.get("text")
-                if index is None or text is None:
-                    return {"success": False, "error": "Missing index or text for input"}
-                result = self.browser_controller.execute_command("input_text", index, text)
-                return {"success": result, "message": f"Input text '{text}' into element {index}"}
-                
-            elif action_name == "switch_tab":
-                index = action_params.get("index")
-                if index is None:
-                    return {"success": False, "error": "No tab index provided"}
-                result = self.browser_controller.execute_command("switch_tab", int(index))
-                return {"success": result, "message": f"Switched to tab {index}"}
-                
-            elif action_name == "open_tab":
-                url = action_params.get("url")
-                result = self.browser_controller.execute_command("open_tab", url)
-                return {"success": bool(result), "message": f"Opened new tab", "tab_info": result}
-                
-            elif action_name == "close_tab":
-                index = action_params.get("index")
-                if index is None:
-                    return {"success": False, "error": "No tab index provided"}
-                result = self.browser_controller.execute_command("close_tab", int(index))
-                return {"success": result, "message": f"Closed tab {index}"}
-                
-            elif action_name == "go_back":
-                result = self.browser_controller.execute_command("go_back")
-                return {"success": result, "message": "Navigated back"}
-                
-            elif action_name == "tools":
-                reason = action_params.get("reason", "No reason provided")
-                result = self.browser_controller.execute_command("tools", reason)
-                
-                # Save tool output to memory with request reason
-                tool_output = {
-                    "message": result.get("message", f"Tools action executed with reason: {reason}"),
-                    "findings": result.get("data", {}).get("findings", ""),
-                    "validation_passed": result.get("data", {}).get("validation_passed", None)
-                }
-                self.memory.save_tool_output(
-                    tool_output=tool_output,
-                    step_number=len(self.previous_steps) + 1,
-                    request_reason=reason
-                )
-                
-                return {"success": result.get("success", True), "message": result.get("message", f"Tools action executed with reason: {reason}"), "data": result.get("data", {})}
-                
-            elif action_name == "end":
-                reason = action_params.get("reason", "Session ended by user request")
-                result = self.browser_controller.execute_command("end", reason)
-                
-                # Export memory data when session ends
-                try:
-                    memory_export_path = debug_logger.get_debug_file_path("memory_export")
-                    memory_export_path = memory_export_path.replace('.log', '.json')
-                    self.memory.export_session_data(memory_export_path)
-                except Exception as e:
-                    print(f"Error exporting memory data: {str(e)}")
-                    # Silent fail for memory export - don't break main execution
-                    pass
-                
-                return {"success": result, "message": f"Session ended: {reason}", "terminate": True}
-                
-            else:
-                return {"success": False, "error": f"Unknown action: {action_name}"}
-                
+            return handler(action_params)
         except Exception as e:
             print(f"Exception during action execution: {str(e)}")
             return {"success": False, "error": f"Exception during execution: {str(e)}"}
-            
+
+    def _do_navigate_to(self, action_params: Dict[str, Any]) -> Dict[str, Any]:
+        url = action_params.get("url")
+        if not url:
+            return {"success": False, "error": "No URL provided for navigation"}
+        result = self.browser_controller.execute_command("navigate_to", url)
+        return {"success": result, "message": f"Navigated to {url}"}
+
+    def _do_click_element(self, action_params: Dict[str, Any]) -> Dict[str, Any]:
+        index = action_params.get("index")
+        if index is None:
+            return {"success": False, "error": "No element index provided"}
+        result = self.browser_controller.execute_command("click_element", index)
+        return {"success": result, "message": f"Clicked element at index {index}"}
+
+    def _do_input_text(self, action_params: Dict[str, Any]) -> Dict[str, Any]:
+        index = action_params.get("index")
+        text = action_params.get("text")
+        if index is None or text is None:
+            return {"success": False, "error": "Missing index or text for input"}
+        result = self.browser_controller.execute_command("input_text", index, text)
+        return {"success": result, "message": f"Input text '{text}' into element {index}"}
+
+    def _do_switch_tab(self, action_params: Dict[str, Any]) -> Dict[str, Any]:
+        index = action_params.get("index")
+        if index is None:
+            return {"success": False, "error": "No tab index provided"}
+        result = self.browser_controller.execute_command("switch_tab", int(index))
+        return {"success": result, "message": f"Switched to tab {index}"}
+
+    def _do_open_tab(self, action_params: Dict[str, Any]) -> Dict[str, Any]:
+        url = action_params.get("url")
+        result = self.browser_controller.execute_command("open_tab", url)
+        return {"success": bool(result), "message": f"Opened new tab", "tab_info": result}
+
+    def _do_close_tab(self, action_params: Dict[str, Any]) -> Dict[str, Any]:
+        index = action_params.get("index")
+        if index is None:
+            return {"success": False, "error": "No tab index provided"}
+        result = self.browser_controller.execute_command("close_tab", int(index))
+        return {"success": result, "message": f"Closed tab {index}"}
+
+    def _do_go_back(self, action_params: Dict[str, Any]) -> Dict[str, Any]:
+        result = self.browser_controller.execute_command("go_back")
+        return {"success": result, "message": "Navigated back"}
+
+    def _do_tools(self, action_params: Dict[str, Any]) -> Dict[str, Any]:
+        reason = action_params.get("reason", "No reason provided")
+        result = self.browser_controller.execute_command("tools", reason)
+
+        # Normalize the result fields once so the memory entry and
+        # the returned value share the same extracted data
+        data = result.get("data", {})
+        message = result.get("message", f"Tools action executed with reason: {reason}")
+
+        # Save tool output to memory with request reason
+        tool_output = {
+            "message": message,
+            "findings": data.get("findings", ""),
+            "validation_passed": data.get("validation_passed", None)
+        }
+        self.memory.save_tool_output(
+            tool_output=tool_output,
+            step_number=self._total_steps + 1,
+            request_reason=reason
+        )
+
+        return {"success": result.get("success", True), "message": message, "data": data}
+
+    def _do_end(self, action_params: Dict[str, Any]) -> Dict[str, Any]:
+        reason = action_params.get("reason", "Session ended by user request")
+        result = self.browser_controller.execute_command("end", reason)
+
+        # Export memory data when session ends
+        try:
+            memory_export_path = debug_logger.get_debug_file_path("memory_export")
+            memory_export_path = memory_export_path.replace('.log', '.json')
+            self.memory.export_session_data(memory_export_path)
+        except Exception as e:
+            print(f"Error exporting memory data: {str(e)}")
+            # Silent fail for memory export - don't break main execution
+            pass
+
+        return {"success": result, "message": f"Session ended: {reason}", "terminate": True}
+
     def refresh_browser_state(self):
         """Refresh the current browser state from the browser controller."""
         if not self.browser_controller:
@@ -425,7 +580,8 @@ Interactive Elements:
             self.recent_alerts = self.browser_controller.get_recent_alerts()
             # Clear after reading so stale alerts don't persist across steps
             self.browser_controller.clear_alerts()
-            
+            self._browser_state_dirty = True
+
         except Exception as e:
             print(f"Error refreshing browser state: {str(e)}")
             self.current_url = "Error: Unable to get current URL"
@@ -433,6 +589,7 @@ Interactive Elements:
             self.interactive_elements = "Error: Unable to get interactive elements"
             self.valid_actions = "Error: Unable to get available actions"
             self.recent_alerts = []
+            self._browser_state_dirty = True
             
             
     def execute_plan(self, user_goal: str) -> List[Dict[str, Any]]:
@@ -445,7 +602,7 @@ Interactive Elements:
             
         execution_log = []
         
-        while len(self.previous_steps) < self.max_actions:
+        while self._total_steps < self.max_actions:
             # Refresh browser state
             self.refresh_browser_state()
             
@@ -453,27 +610,31 @@ Interactive Elements:
             action_response = self.get_next_action(user_goal)
             
             execution_log.append({
-                "step": len(self.previous_steps) + 1,
+                "step": self._total_steps + 1,
                 "llm_response": action_response,
                 "timestamp": datetime.now().isoformat()
             })
             
             # Check if we should stop
             actions = action_response.get("action", [])
-                
+
             # Filter out 'end' actions when chained with other actions
             actions = self._filter_chained_end_actions(actions)
-                
-            # Execute each action in sequence
+
+            # Execute each action in sequence. Actions within a response are
+            # deliberately NOT fanned out to a thread pool: every command
+            # funnels into one sync-Playwright BrowserSession, which is bound
+            # to the thread that created it, and later actions routinely
+            # depend on page state the earlier ones produced (open tab, then
+            # click into it). Cross-case parallelism lives in
+            # test_agent_main.execute_all_test_cases instead, where each
+            # worker owns its own session.
             all_success = True
             action_results = []
             should_terminate = False
-            
-            # Filter out 'end' actions if they are chained with other actions
-            actions = self._filter_chained_end_actions(actions)
-            
+
             for action_item in actions:
-                action_name = list(action_item.keys())[0]
+                action_name = next(iter(action_item))
                 
                 # Execute the action (including termination actions)
                 try:
@@ -520,13 +681,19 @@ Interactive Elements:
         
     def reset_session(self):
         """Reset the current session and create a new memory instance."""
-        self.previous_steps = []
+        self.previous_steps = deque(maxlen=self.max_actions)
+        self._total_steps = 0
+        self._successful_steps = 0
+        self._failed_steps = 0
         self.current_url = ""
         self.open_tabs = []
         self.interactive_elements = ""
         self.valid_actions = ""
         self.session_start_time = datetime.now()
-        
+        self._browser_state_dirty = True
+        self._prev_steps_cache = "No previous steps in this session."
+        self._prev_steps_cache_version = 0
+
         # Create a new memory instance for the new session
         self.memory = EnhancedMemory(debug_file_path=self.debug_file)
                     
@@ -539,16 +706,16 @@ Interactive Elements:
         
         return {
             "session_duration_seconds": session_duration,
-            "total_steps": len(self.previous_steps),
-            "successful_steps": len([s for s in self.previous_steps if s["success"]]),
-            "failed_steps": len([s for s in self.previous_steps if not s["success"]]),
+            "total_steps": self._total_steps,
+            "successful_steps": self._successful_steps,
+            "failed_steps": self._failed_steps,
             "current_url": self.current_url,
             "open_tabs_count": len(self.open_tabs),
             "memory_llm_states": memory_summary["total_llm_states"],
             "memory_tool_executions": memory_summary["total_tool_executions"],
             "memory_goal_success_rate": memory_summary["goal_success_rate"],
             "memory_tool_success_rate": memory_summary["tool_success_rate"],
-            "last_action": self.previous_steps[-1]["action"] if self.previous_steps else None,
+            "last_action": self.previous_steps[-1].action if self.previous_steps else None,
             "browser_controller_attached": self.browser_controller is not None
         }
         
@@ -562,9 +729,9 @@ Interactive Elements:
             
         session_data = {
             "session_summary": self.get_session_summary(),
-            "previous_steps": self.previous_steps,
-            "memory_llm_states": self.memory.llm_states,
-            "memory_tool_outputs": self.memory.tool_outputs,
+            "previous_steps": [asdict(step) for step in self.previous_steps],
+            "memory_llm_states": list(self.memory.llm_states),
+            "memory_tool_outputs": list(self.memory.tool_outputs),
             "memory_execution_summary": self.memory.get_execution_summary(),
             "final_state": {
                 "current_url": self.current_url,
@@ -573,9 +740,16 @@ Interactive Elements:
             }
         }
         
+        # Make sure buffered debug output is on disk alongside the session log
+        if self._debug_fh is not None:
+            try:
+                self._debug_fh.flush()
+            except Exception:
+                pass
+
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+                json_utils.dump_stream(session_data, f, indent=True)
             return filename
         except Exception as e:
             print(f"Error saving session log: {str(e)}")
@@ -587,29 +761,29 @@ Interactive Elements:
             return
             
         try:
-            timestamp = datetime.now().isoformat()
+            timestamp = fast_iso_timestamp()
             step_info = f" (Step {step_number})" if step_number else ""
             
             debug_entry = f"""
-{'='*80}
+{_EQ80}
 TIMESTAMP: {timestamp}{step_info}
-{'='*80}
+{_EQ80}
 
 REQUEST TO LLM:
-{'-'*40}
+{_DASH40}
 {request}
-{'-'*40}
+{_DASH40}
 
 RESPONSE FROM LLM:
-{'-'*40}
+{_DASH40}
 {response}
-{'-'*40}
+{_DASH40}
 
 """
             
-            with open(self.debug_file, 'a', encoding='utf-8') as f:
-                f.write(debug_entry)
-                
+            # Reuse one buffered handle instead of open/append/close per step
+            self._get_debug_fh().write(debug_entry)
+
         except Exception as e:
             print(f"Error logging debug information: {str(e)}")
 
@@ -629,7 +803,7 @@ RESPONSE FROM LLM:
             
         # Check if there's an 'end' action in a list with multiple actions
         has_end_action = any(
-            list(action.keys())[0] == "end" 
+            next(iter(action)) == "end" 
             for action in actions 
             if isinstance(action, dict) and action
         )
@@ -638,7 +812,7 @@ RESPONSE FROM LLM:
             # Filter out 'end' actions when chained with others
             filtered_actions = [
                 action for action in actions 
-                if not (isinstance(action, dict) and action and list(action.keys())[0] == "end")
+                if not (isinstance(action, dict) and action and next(iter(action)) == "end")
             ]
             return filtered_actions
             
@@ -1,11 +1,9 @@
 from typing import Optional
-# Set up project root and add to sys.path
-import os
-import sys
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-sys.path.insert(0, PROJECT_ROOT)
 
-SYSTEM_PROMPT_TEMPLATE = '''
+# Static prefix of the system prompt. It contains no substitutions and is
+# byte-identical for every agent, so provider-side prompt-prefix caches can
+# reuse its prefill across agents regardless of their per-agent settings.
+SYSTEM_PROMPT_STATIC_PREFIX = '''
 You are an AI agent designed to automate browser component testing. Your goal is to accomplish the ultimate task following the rules.
 
 # Input Format
@@ -30,19 +28,19 @@ Interactive Elements
 # Response Rules
 
 1. RESPONSE FORMAT: You must ALWAYS respond with valid JSON in this exact format:
-   {{"current_state": {{"evaluation_previous_goal": "Success|Failed|Unknown - Analyze the current elements and the image to check if the previous goals/actions are successful like intended by the task. Mention if something unexpected happened. Shortly state why/why not",
+   {"current_state": {"evaluation_previous_goal": "Success|Failed|Unknown - Analyze the current elements and the image to check if the previous goals/actions are successful like intended by the task. Mention if something unexpected happened. Shortly state why/why not",
    "memory": "Description of what has been done and what you need to remember. Be very specific. Count here ALWAYS how many times you have done something and how many remain. E.g. 0 out of 10 websites analyzed. Continue with abc and xyz",
-   "next_goal": "What needs to be done with the next immediate action"}},
-   "action":[{{"one_action_name": {{// action-specific parameter}}}}, // ... more actions in sequence]}}
+   "next_goal": "What needs to be done with the next immediate action"},
+   "action":[{"one_action_name": {// action-specific parameter}}, // ... more actions in sequence]}
 
-2. ACTIONS: You can specify multiple actions in the list to be executed in sequence. But always specify only one action name per item. Use maximum {max_actions_per_step} actions per sequence.
+2. ACTIONS: You can specify multiple actions in the list to be executed in sequence. But always specify only one action name per item.
 Common action sequences:
 
-- Form filling: [{{"input_text": {{"index": 1, "text": "username"}}}}, {{"input_text": {{"index": 2, "text": "password"}}}}, {{"click_element": {{"index": 3}}}}]
-- Navigation and extraction: [{{"navigate_to": {{"url": "https://example.com"}}}}]
-- Tab Operations: [{{"switch_tab": {{"index": "0"}}}}, {{"close_tab": {{"index": "1"}}}}]
-- Tool Actions: [{{"tools": {{ "reason": "Give detailed reason about why tool is necessary (e.g.verify login, validate form data)"}}}}]
-- Ending: [{{"end": {{"reason": "Give detailed reason why the task is done"}}}}]
+- Form filling: [{"input_text": {"index": 1, "text": "username"}}, {"input_text": {"index": 2, "text": "password"}}, {"click_element": {"index": 3}}]
+- Navigation and extraction: [{"navigate_to": {"url": "https://example.com"}}]
+- Tab Operations: [{"switch_tab": {"index": "0"}}, {"close_tab": {"index": "1"}}]
+- Tool Actions: [{"tools": { "reason": "Give detailed reason about why tool is necessary (e.g.verify login, validate form data)"}}]
+- Ending: [{"end": {"reason": "Give detailed reason why the task is done"}}]
 - You can use tools for every action that requires a more complex operation, like verifying a login or validating form data.
 - Actions are executed in the given order
 - If the page changes after an action, the sequence is interrupted and you get the new state.
@@ -52,6 +50,14 @@ Common action sequences:
 - You need to validate if the task is done before using end action.
 '''
 
+# Per-agent substitutions live at the very end of the prompt, after the
+# cacheable prefix above
+SYSTEM_PROMPT_DYNAMIC_SUFFIX = '''
+# Limits
+
+Use maximum {max_actions_per_step} actions per sequence.
+'''
+
 
 class SystemPromptBase:
     def __init__(
@@ -65,22 +71,17 @@ class SystemPromptBase:
         self.extend_system_message = extend_system_message
 
     def get_prompt(self) -> str:
-        # Choose base prompt: override or template
+        # Choose base prompt: override or static prefix + dynamic suffix
         if self.override_system_message:
             base = self.override_system_message
         else:
-            # Inject max_actions_per_step into template
-            base = SYSTEM_PROMPT_TEMPLATE.format(max_actions_per_step=self.max_actions_per_step)
+            base = SYSTEM_PROMPT_STATIC_PREFIX + SYSTEM_PROMPT_DYNAMIC_SUFFIX.format(
+                max_actions_per_step=self.max_actions_per_step
+            )
 
-        # Append any extended custom message
+        # Append any extended custom message (kept last so the shared
+        # prefix stays identical across agents)
         if self.extend_system_message:
             base += "\n" + self.extend_system_message
 
         return base
-
-
-
-
-
-
-
@@ -1,12 +1,19 @@
 import json
+import re
 from typing import Dict, Any, Optional
-from datetime import datetime
-from pathlib import Path
-import os
-import sys
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-sys.path.insert(0, PROJECT_ROOT)
 from src.browser.browser_context import BrowserSession
+from src.agent.core_utils.logging_utils import fast_iso_timestamp
+from src.agent.core_utils.action_cache import ActionCache
+from src.agent.core_utils import json_utils
+
+# Banner strings reused by the debug-log helpers, built once at import
+_EQ80 = '=' * 80
+_DASH40 = '-' * 40
+
+# Collapse runs of whitespace so trivially rephrased-by-spacing requests
+# normalize to the same cache key
+_WS = re.compile(r"\s+")
+
 
 class Tools:
     """
@@ -25,7 +32,10 @@ class Tools:
         self.llm_client = llm_client
         self.log_debug_func = log_debug_func
         self.debug_file_path = debug_file_path
-        
+        # Repeat analyses of an unchanged page answer from cache instead of
+        # paying another LLM round-trip
+        self._analysis_cache = ActionCache(capacity=100)
+
     def set_logging_functions(self, log_debug_func=None, debug_file_path=None):
         """
         Set or update the logging functions for the Tools class.
@@ -46,14 +56,14 @@ class Tools:
             
         try:
             with open(self.debug_file_path, 'a', encoding='utf-8') as f:
-                f.write(f"\n{'='*80}\n")
+                f.write(f"\n{_EQ80}\n")
                 f.write(f"TOOLS LLM REQUEST\n")
-                f.write(f"TIMESTAMP: {datetime.now().isoformat()}\n")
-                f.write(f"{'='*80}\n\n")
+                f.write(f"TIMESTAMP: {fast_iso_timestamp()}\n")
+                f.write(f"{_EQ80}\n\n")
                 f.write("REQUEST TO LLM:\n")
-                f.write("-" * 40 + "\n")
+                f.write(_DASH40 + "\n")
                 f.write(request_prompt)
-                f.write(f"\n{'-'*40}\n\n")
+                f.write(f"\n{_DASH40}\n\n")
         except Exception as e:
             pass
     
@@ -65,9 +75,9 @@ class Tools:
         try:
             with open(self.debug_file_path, 'a', encoding='utf-8') as f:
                 f.write("RESPONSE FROM LLM:\n")
-                f.write("-" * 40 + "\n")
+                f.write(_DASH40 + "\n")
                 f.write(response)
-                f.write(f"\n{'-'*40}\n\n")
+                f.write(f"\n{_DASH40}\n\n")
         except Exception as e:
             pass
         
@@ -95,18 +105,33 @@ class Tools:
             
             # Get current page information
             page_info = self._get_page_info(browser_context)
-            
+
+            # Identical request against an identical page state yields the
+            # same analysis — serve it from the LRU cache when possible.
+            # Pages with pending alerts are never cached (transient state).
+            cache_key = None
+            if "error" not in page_info and not page_info.get("has_alerts"):
+                normalized_reason = _WS.sub(" ", reason.strip().lower())
+                cache_key = (page_info.get("url"), normalized_reason,
+                             hash(page_info.get("element_tree", "")))
+                cached = self._analysis_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
             # Use LLM for all validation and analysis
             llm_result = self._analyze_with_llm(reason, page_info, active_llm)
-            
-            return {
+
+            result = {
                 "message": llm_result.get("message", "Analysis completed successfully"),
                 "data": {
                     "findings": llm_result.get("findings", ""),
                     "validation_passed": llm_result.get("validation_passed", False)
                 }
             }
-            
+            if cache_key is not None:
+                self._analysis_cache.put(cache_key, result)
+            return result
+
         except Exception as e:
             return {
                 "message": f"Tools action failed: {e}",
@@ -183,8 +208,10 @@ Based on the analysis request and current page state, please provide your assess
 Focus on the specific request and provide actionable insights. If there were any browser alerts, include them in your analysis as they may be important for understanding the current state of the page.
 """
 
-            # Log the tools LLM request and response if debug logging is enabled
-            if self.log_debug_func:
+            # Log the tools LLM request and response if debug logging is
+            # enabled — gate on debug_file_path, the condition the log
+            # helpers actually check, so no work happens when it is unset
+            if self.debug_file_path:
                 try:
                     self._log_tools_llm_request(analysis_prompt)
                 except Exception:
@@ -194,21 +221,15 @@ Focus on the specific request and provide actionable insights. If there were any
             llm_response = llm_client.ask(analysis_prompt)
             
             # Log the tools LLM response if debug logging is enabled
-            if self.log_debug_func:
+            if self.debug_file_path:
                 try:
                     self._log_tools_llm_response(llm_response)
                 except Exception:
                     pass  # Don't let logging errors break the tools functionality
             
-            # Parse JSON response
+            # Parse JSON response, tolerating markdown fences
             try:
-                # Clean up the response
-                if llm_response.startswith("```json"):
-                    llm_response = llm_response[7:]
-                if llm_response.endswith("```"):
-                    llm_response = llm_response[:-3]
-                    
-                analysis_result = json.loads(llm_response.strip())
+                analysis_result = json_utils.extract_json(llm_response)
                 
                 return {
                     "message": analysis_result.get("message", "LLM analysis completed"),
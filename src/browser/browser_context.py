@@ -1,10 +1,4 @@
-import os
-import sys
-
-# Add the project root to Python path so imports work
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, PROJECT_ROOT)
-
+from collections import deque
 from typing import Optional, List, Dict, Any
 from playwright.sync_api import Page, BrowserContext, sync_playwright, Browser
 from src.browser.dom_tree_parser import DOMTreeParser, DOMElementNode
@@ -28,8 +22,10 @@ class BrowserSession:
         self._selector_map: Optional[Dict[int, DOMElementNode]] = None
         
         # Alert tracking
-        self._recent_alerts: List[Dict[str, Any]] = []
         self._max_alert_history: int = 10
+        # deque(maxlen=...) evicts the oldest alert in O(1) on append,
+        # instead of list.pop(0) shifting the whole history each time
+        self._recent_alerts: deque = deque(maxlen=self._max_alert_history)
 
     def _initialize_session(self, headless: bool = True) -> Browser:
         if self._playwright is None:
@@ -255,8 +251,6 @@ class BrowserSession:
         """
         Track an alert message.
         """
-        if len(self._recent_alerts) >= self._max_alert_history:
-            self._recent_alerts.pop(0)  # remove oldest alert
         self._recent_alerts.append({
             "message": message,
             "type": alert_type
@@ -266,7 +260,7 @@ class BrowserSession:
         """
         Get the list of recent alerts.
         """
-        return self._recent_alerts
+        return list(self._recent_alerts)
 
     def clear_alerts(self) -> None:
         """
@@ -1,10 +1,5 @@
 import time
-import sys
-import os
 
-# Add the project root to Python path so imports work
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, PROJECT_ROOT)
 
 class DomTreeBuilder:
     def __init__(self, page, debug_mode=False):
@@ -91,9 +86,9 @@ class DomTreeBuilder:
         if not self.debug_mode:
             return fn()
 
-        start = time.time()
+        start = time.perf_counter()
         result = fn()
-        duration = (time.time() - start) * 1000
+        duration = (time.perf_counter() - start) * 1000
 
         if metric_name and metric_name in self.perf_metrics["timings"]:
             self.perf_metrics["timings"][metric_name] += duration
@@ -140,7 +135,7 @@ class DomTreeBuilder:
         if element_handle is None:
             return None
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         if self.debug_mode:
             self.perf_metrics["node_metrics"]["total_nodes"] += 1
 
@@ -188,7 +183,7 @@ class DomTreeBuilder:
                 node_data["children"].append(child_tree)
 
         if self.debug_mode:
-            duration = (time.time() - start_time) * 1000
+            duration = (time.perf_counter() - start_time) * 1000
             self.perf_metrics["timings"]["build_dom_tree"] += duration
 
         return node_data
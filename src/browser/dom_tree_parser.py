@@ -1,25 +1,22 @@
 import json
-import os
-import sys
+from sys import intern
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-
-# Add the project root to Python path so imports work
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, PROJECT_ROOT)
-
 from src.browser.dom_tree_builder import DomTreeBuilder
 
 
-@dataclass
+# slots=True: a parsed page holds thousands of these nodes, and dropping the
+# per-instance __dict__ roughly halves their memory and speeds attribute
+# access during _flatten/_dump traversals
+@dataclass(slots=True)
 class DOMTextNode:
     text: str
     is_visible: bool
     parent: Optional["DOMElementNode"] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DOMElementNode:
     tag_name: str
     xpath: str
@@ -40,7 +37,10 @@ class DOMTreeParser:
         self.page = page
         self.dom_tree: Optional[DOMElementNode] = None
         self._raw_json: Optional[Dict[str, Any]] = None
-        self._counts: Dict[str, int] = {}
+        # Bumped on every parse(); get_dom_string() caches against it
+        self._generation = 0
+        self._dom_string_cache: Optional[str] = None
+        self._dom_string_generation = -1
 
     def parse(self) -> DOMElementNode:
         """
@@ -49,7 +49,7 @@ class DOMTreeParser:
         """
         data = DomTreeBuilder(self.page, debug_mode=False).get_dom_tree()
         self._raw_json = data["tree"]
-        self._counts.clear()
+        self._generation += 1
         # Start XPath with /html[1]/ since DomTreeBuilder starts from body element
         self.dom_tree = self._build_element(self._raw_json, parent_xpath="/html[1]/", parent=None)
         return self.dom_tree
@@ -60,46 +60,77 @@ class DOMTreeParser:
         parent_xpath: str,
         parent: Optional[DOMElementNode],
     ) -> DOMElementNode:
-        """Recursively construct DOMElementNode (and its text-node children)."""
-        tag = node["nodeName"]
-        key = f"{parent_xpath}{tag}"
-        self._counts[key] = self._counts.get(key, 0) + 1
-        xpath = f"{parent_xpath}{tag}[{self._counts[key]}]"
-
-        is_visible = node.get("isVisible", True)
-        is_interactive = node.get("isInteractive", False)
-        inner_text = node.get("innerText", "")
-
-        elm = DOMElementNode(
+        """
+        Construct DOMElementNode (and its text-node children) iteratively.
+
+        An explicit stack replaces recursion: no Python call frame per DOM
+        node and no recursion-limit risk on deeply nested pages. Tag names
+        are interned so the thousands of repeated 'div'/'span' strings on a
+        large page share one object and compare by pointer. Sibling indexes
+        for the xpath come from a small per-parent tag counter, so no
+        parser-wide table keyed on full path prefixes is built or hashed.
+        """
+        root = self._new_node(node, parent_xpath, parent, 1)
+        stack = [(node, root)]
+        while stack:
+            json_node, elm = stack.pop()
+            child_xpath = elm.xpath + "/"
+            tag_counts: Dict[str, int] = {}
+            for child in json_node.get("children", []):
+                if not isinstance(child, dict):
+                    continue
+                if child.get("nodeName") == "#text":
+                    text = child.get("textContent", "").strip()
+                    if text:
+                        elm.children.append(
+                            DOMTextNode(text=text, is_visible=elm.is_visible, parent=elm)
+                        )
+                else:
+                    tag = intern(child["nodeName"])
+                    index = tag_counts.get(tag, 0) + 1
+                    tag_counts[tag] = index
+                    child_elm = self._new_node(child, child_xpath, elm, index)
+                    elm.children.append(child_elm)
+                    stack.append((child, child_elm))
+        return root
+
+    def _new_node(
+        self,
+        node: Dict[str, Any],
+        parent_xpath: str,
+        parent: Optional[DOMElementNode],
+        index: int,
+    ) -> DOMElementNode:
+        """Build one DOMElementNode with its sibling-indexed xpath."""
+        tag = intern(node["nodeName"])
+        return DOMElementNode(
             tag_name=tag,
-            xpath=xpath,
+            xpath=f"{parent_xpath}{tag}[{index}]",
             attributes=node.get("attributes", {}),
             children=[],
-            is_visible=is_visible,
-            is_interactive=is_interactive,
-            inner_text=inner_text,
+            is_visible=node.get("isVisible", True),
+            is_interactive=node.get("isInteractive", False),
+            inner_text=node.get("innerText", ""),
             parent=parent,
         )
 
-        for child in node.get("children", []):
-            if isinstance(child, dict) and child.get("nodeName") == "#text":
-                text = child.get("textContent", "").strip()
-                if text:
-                    elm.children.append(DOMTextNode(text=text, is_visible=is_visible, parent=elm))
-            elif isinstance(child, dict):
-                elm.children.append(self._build_element(child, xpath + "/", elm))
-
-        return elm
-
     def get_dom_string(self) -> str:
         """
         Return an indented string representation of the DOM tree.
+
+        The rendered string is cached per parse() generation, so repeated
+        calls between parses return the same object instead of re-walking
+        the tree.
         """
         if not self.dom_tree:
             raise ValueError("DOM tree not built, call parse() first.")
+        if self._dom_string_generation == self._generation:
+            return self._dom_string_cache
         lines: List[str] = []
         self._dump(self.dom_tree, indent="", lines=lines)
-        return "\n".join(lines)
+        self._dom_string_cache = "\n".join(lines)
+        self._dom_string_generation = self._generation
+        return self._dom_string_cache
 
     def _dump(self, node: Any, indent: str, lines: List[str]) -> None:
         """Helper to serialize tree into a list of lines."""
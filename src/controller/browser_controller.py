@@ -1,14 +1,67 @@
 from typing import Optional, Dict, Any, Union, List
-import os
-import sys
-# Add the project root to Python path so imports work
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, PROJECT_ROOT)
 # Import from the browser package
 from src.browser.browser_context import BrowserSession
 # Import from the tools package
 from src.agent.tool_agent.tools import Tools
 
+# All command names known to execute_command, frozen at module scope so
+# available_commands() returns a shared constant instead of a fresh list
+_AVAILABLE_COMMANDS = (
+    "navigate_to",
+    "click_element",
+    "input_text",
+    "switch_tab",
+    "open_tab",
+    "close_tab",
+    "go_back",
+    "tools",
+    "end",
+)
+
+# Static action descriptions used to build the LLM-facing help text.
+# Keyed by the exact command_map names.
+_ACTION_DESCRIPTIONS = {
+    "navigate_to": """navigate_to: Navigate to a URL
+   Format: {"navigate_to": {"url": "string"}}
+   Example: {"navigate_to": {"url": "https://example.com"}}""",
+
+    "click_element": """click_element: Click on an interactive element by its index
+   Format: {"click_element": {"index": number}}
+   Example: {"click_element": {"index": 0}}
+   Note: Use element indices from the Interactive Elements list""",
+
+    "input_text": """input_text: Type text into an input field by its index
+   Format: {"input_text": {"index": number, "text": "string"}}
+   Example: {"input_text": {"index": 1, "text": "hello@example.com"}}
+   Note: Use element indices from the Interactive Elements list""",
+
+    "switch_tab": """switch_tab: Switch to a different browser tab
+   Format: {"switch_tab": {"index": number}}
+   Example: {"switch_tab": {"index": 1}}""",
+
+    "open_tab": """open_tab: Open a new browser tab (optionally with URL)
+   Format: {"open_tab": {"url": "string"}} or {"open_tab": {}}
+   Example: {"open_tab": {"url": "https://google.com"}}""",
+
+    "close_tab": """close_tab: Close a browser tab by its index
+   Format: {"close_tab": {"index": number}}
+   Example: {"close_tab": {"index": 1}}""",
+
+    "go_back": """go_back: Navigate back in browser history
+   Format: {"go_back": {}}
+   Example: {"go_back": {}}""",
+
+    "tools": """tools: Execute tools action for complex operations
+   Format: {"tools": {"reason": "string"}}
+   Example: {"tools": {"reason": "Need to verify login success or validate form data"}}""",
+
+    "end": """end: End the browser session and terminate the automation
+   Format: {"end": {"reason": "string"}}
+   Example: {"end": {"reason": "Task completed successfully"}}
+   Note: This action closes the browser session and stops the LLM"""
+}
+
+
 class BrowserController:
     """
     Controller class that wraps the BrowserSession to provide high-level browser operations.
@@ -24,12 +77,11 @@ class BrowserController:
         # Store logging functions for tools integration
         self.log_debug_func = None
         self.debug_file_path = None
-
-    def execute_command(self, command: str, *args) -> Union[bool, Dict[str, Any], str]:
-        """
-        Execute a browser command with the provided arguments.
-        """
-        command_map = {
+        # Response cache for the actions description, keyed by the tuple of
+        # available actions — the text is a pure function of that tuple
+        self._actions_description_cache: Dict[tuple, str] = {}
+        # Dispatch table built once instead of per execute_command call
+        self._command_map = {
             "go_back":       self.go_back,
             "click_element": self.click_element_by_index,
             "input_text":    self.input_text,
@@ -41,11 +93,16 @@ class BrowserController:
             "end":           self.end,
         }
 
-        if command not in command_map:
+    def execute_command(self, command: str, *args) -> Union[bool, Dict[str, Any], str]:
+        """
+        Execute a browser command with the provided arguments.
+        """
+        handler = self._command_map.get(command)
+        if handler is None:
             return False
 
         try:
-            return command_map[command](*args)
+            return handler(*args)
         except Exception as e:
             return False
 
@@ -170,19 +227,9 @@ class BrowserController:
         except Exception as e:
             return False
 
-    def available_commands(self) -> list:
-        """Return a list of available command names."""
-        return [
-            "navigate_to",
-            "click_element", 
-            "input_text",
-            "switch_tab",
-            "open_tab",
-            "close_tab",
-            "go_back",
-            "tools",
-            "end"
-        ]
+    def available_commands(self) -> tuple:
+        """Return the tuple of available command names."""
+        return _AVAILABLE_COMMANDS
     
     def get_available_actions(self) -> list:
         """
@@ -237,59 +284,25 @@ class BrowserController:
 
     def get_available_actions_description(self) -> str:
         """Return a detailed description of currently available actions for the LLM."""
-        available_actions = self.get_available_actions()
-        
-        # Action descriptions mapping - using exact command_map names
-        action_descriptions = {
-            "navigate_to": """navigate_to: Navigate to a URL
-   Format: {"navigate_to": {"url": "string"}}
-   Example: {"navigate_to": {"url": "https://example.com"}}""",
-   
-            "click_element": """click_element: Click on an interactive element by its index
-   Format: {"click_element": {"index": number}}
-   Example: {"click_element": {"index": 0}}
-   Note: Use element indices from the Interactive Elements list""",
-   
-            "input_text": """input_text: Type text into an input field by its index
-   Format: {"input_text": {"index": number, "text": "string"}}
-   Example: {"input_text": {"index": 1, "text": "hello@example.com"}}
-   Note: Use element indices from the Interactive Elements list""",
-   
-            "switch_tab": """switch_tab: Switch to a different browser tab
-   Format: {"switch_tab": {"index": number}}
-   Example: {"switch_tab": {"index": 1}}""",
-   
-            "open_tab": """open_tab: Open a new browser tab (optionally with URL)
-   Format: {"open_tab": {"url": "string"}} or {"open_tab": {}}
-   Example: {"open_tab": {"url": "https://google.com"}}""",
-   
-            "close_tab": """close_tab: Close a browser tab by its index
-   Format: {"close_tab": {"index": number}}
-   Example: {"close_tab": {"index": 1}}""",
-   
-            "go_back": """go_back: Navigate back in browser history
-   Format: {"go_back": {}}
-   Example: {"go_back": {}}""",
-   
-            "tools": """tools: Execute tools action for complex operations
-   Format: {"tools": {"reason": "string"}}
-   Example: {"tools": {"reason": "Need to verify login success or validate form data"}}""",
-   
-            "end": """end: End the browser session and terminate the automation
-   Format: {"end": {"reason": "string"}}
-   Example: {"end": {"reason": "Task completed successfully"}}
-   Note: This action closes the browser session and stops the LLM"""
-        }
-        
+        available_actions = tuple(self.get_available_actions())
+
+        # The description only depends on which actions are available, so
+        # reuse the built string when the same action set comes up again
+        cached = self._actions_description_cache.get(available_actions)
+        if cached is not None:
+            return cached
+
         # Build description for currently available actions
         descriptions = ["Currently Available Browser Actions:\n"]
-        
+
         counter = 1
         for action in available_actions:
-            if action in action_descriptions:
-                descriptions.append(f"{counter}. {action_descriptions[action]}")
-                counter += 1         
-        return "\n".join(descriptions)
+            if action in _ACTION_DESCRIPTIONS:
+                descriptions.append(f"{counter}. {_ACTION_DESCRIPTIONS[action]}")
+                counter += 1
+        result = "\n".join(descriptions)
+        self._actions_description_cache[available_actions] = result
+        return result
 
     def close(self) -> None:
         try:
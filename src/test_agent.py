@@ -1,10 +1,4 @@
 
-import os
-import sys
-
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, PROJECT_ROOT)
-
 # Import the required classes from the agent package
 from src.agent.main_agent.agent import Agent
 from src.agent.core_utils.llm import LLMClient
@@ -43,6 +37,7 @@ class TestAgent:
         self.llm = None
         self.agent = None
         self.browser_controller = None
+        self.analysis_llm = None
         self.test_analyzer = None
         
     def __enter__(self):
@@ -60,8 +55,13 @@ class TestAgent:
             # Initialize LLM client via LiteLLM
             self.llm = LLMClient(model=self.model, provider=self.provider)
             
-            # Initialize test result analyzer
-            self.test_analyzer = TestResultAnalyzer(llm_client=self.llm)
+            # Initialize test result analyzer with its own deterministic
+            # client: analysis wants a stable verdict, and temperature 0 is
+            # also what arms the exact-match response cache in LLMClient
+            self.analysis_llm = LLMClient(model=self.model,
+                                          provider=self.provider,
+                                          temperature=0)
+            self.test_analyzer = TestResultAnalyzer(llm_client=self.analysis_llm)
             
             # Initialize browser controller with LLM client for intelligent tools
             self.browser_controller = BrowserController(llm_client=self.llm, headless=self.headless)
@@ -91,10 +91,11 @@ class TestAgent:
     def cleanup(self):
         """Clean up resources and close browser session."""
         try:
-            # Close browser session properly
-            if self.browser_controller and hasattr(self.browser_controller, 'browser_context'):
-                self.browser_controller.browser_context.close()
-                
+            # Single getattr instead of the hasattr-then-access double lookup
+            browser_context = getattr(self.browser_controller, 'browser_context', None)
+            if browser_context is not None:
+                browser_context.close()
+
         except Exception as e:
             pass
     
@@ -117,9 +118,10 @@ class TestAgent:
             results = self.agent.execute_plan(user_goal)
             
             # Analyze the test results using the memory from execution
-            if hasattr(self.agent, 'memory') and self.agent.memory:
+            memory = getattr(self.agent, 'memory', None)
+            if memory:
                 self.test_analyzer.analyze_test_execution(
-                    memory=self.agent.memory,
+                    memory=memory,
                     original_test_goal=user_goal,
                     expected_outcome=expected_outcome,
                     test_case_name=self.test_case_name,
@@ -2,8 +2,8 @@
 import os
 import sys
 import time
-import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 from dotenv import load_dotenv
 
@@ -14,11 +14,16 @@ _ENV_FILE = os.path.join(
 )
 load_dotenv(_ENV_FILE)
 
-# Add the project root to Python path so imports work
+# Add the project root to Python path so imports work. Guarded append
+# rather than insert(0): re-runs don't pile up duplicate entries, and the
+# project dir never shadows stdlib modules on every future import probe.
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, PROJECT_ROOT)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
 
 from src.test_agent import TestAgent
+from src.agent.core_utils import json_utils
+from src.agent.core_utils.logging_utils import configure_logging
 
 
 class TestAgentMain:
@@ -70,8 +75,10 @@ class TestAgentMain:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Test cases file not found: {filepath}")
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            test_cases = json.load(f)
+        # Read the whole file and decode in one shot; json_utils routes the
+        # parse through orjson when it is installed
+        with open(filepath, 'rb') as f:
+            test_cases = json_utils.loads(f.read())
 
         if not isinstance(test_cases, list):
             raise ValueError(f"Expected a JSON array in {filepath}, got {type(test_cases).__name__}")
@@ -116,21 +123,44 @@ class TestAgentMain:
             # Always cleanup the test agent
             test_agent.cleanup()
     
-    def execute_all_test_cases(self, test_cases: List[Dict[str, Any]]):
+    def execute_all_test_cases(self, test_cases: List[Dict[str, Any]], max_parallel: int = 1,
+                               delay_seconds: int = 40):
         """
         Execute all test cases.
-        
+
+        Each test case owns its own browser session and LLM client, so they are
+        independent and can run concurrently. With max_parallel > 1 the test
+        cases are dispatched to a thread pool (each worker thread starts its own
+        Playwright session); the default of 1 keeps the sequential behavior with
+        the inter-test quota delay.
+
         Args:
             test_cases (list): List of test cases to execute
+            max_parallel (int): Number of test cases to run concurrently
+            delay_seconds (int): Sequential-mode pause between test cases
+                (API quota headroom); 0 disables the wait entirely
         """
+        if max_parallel > 1:
+            with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                futures = {
+                    executor.submit(self.execute_test_case, test_case): i
+                    for i, test_case in enumerate(test_cases, 1)
+                }
+                for future in as_completed(futures):
+                    # as_completed yields in finish order, so report completion
+                    # rather than pretending the case is just starting
+                    print(f"\nCompleted Test Case {futures[future]}")
+                    future.result()
+            return
+
         for i, test_case in enumerate(test_cases, 1):
             print(f"\nExecuting Test Case {i}")
             self.execute_test_case(test_case)
-            
-            # Add 40-second delay between test cases to avoid API quota limits
-            if i < len(test_cases):  # Don't wait after the last test case
-                print(f"Waiting 40 seconds before next test case to avoid API quota limits...")
-                time.sleep(40)
+
+            # Optional delay between test cases to avoid API quota limits
+            if delay_seconds > 0 and i < len(test_cases):  # Don't wait after the last test case
+                print(f"Waiting {delay_seconds} seconds before next test case to avoid API quota limits...")
+                time.sleep(delay_seconds)
 
 
 def parse_args():
@@ -162,6 +192,16 @@ examples:
         "--test-file", type=str, default=None,
         help="Path to test_cases.json (default: test_cases/test_cases.json)",
     )
+    parser.add_argument(
+        "--parallel", type=int, default=1,
+        help="Number of test cases to run concurrently (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--delay", type=int,
+        default=int(os.getenv("TEST_AGENT_DELAY", "40")),
+        help="Seconds to wait between sequential test cases, 0 to disable "
+             "(default: 40, or TEST_AGENT_DELAY env var)",
+    )
     parser.add_argument(
         "--no-headless", dest="headless", action="store_false", default=True,
         help="Show the browser window (default: headless / invisible)",
@@ -178,6 +218,7 @@ def main():
     Entry point — parses CLI args and runs the agent.
     """
     args = parse_args()
+    configure_logging()
 
     # Resolve test file path
     if args.test_file:
@@ -188,12 +229,14 @@ def main():
             "test_cases", "test_cases.json",
         )
 
-    print(f"🤖 Testing Agent")
-    print(f"   Provider : {args.provider}")
-    print(f"   Model    : {args.model}")
-    print(f"   Headless : {args.headless}")
-    print(f"   Test file: {test_cases_file}")
-    print()
+    # One write instead of six — each print acquires the stdout lock
+    print(
+        f"🤖 Testing Agent\n"
+        f"   Provider : {args.provider}\n"
+        f"   Model    : {args.model}\n"
+        f"   Headless : {args.headless}\n"
+        f"   Test file: {test_cases_file}\n"
+    )
 
     # Initialize the main agent
     main_agent = TestAgentMain(
@@ -209,7 +252,8 @@ def main():
         test_cases = main_agent.load_test_cases(test_cases_file)
 
         # Execute all test cases
-        main_agent.execute_all_test_cases(test_cases)
+        main_agent.execute_all_test_cases(test_cases, max_parallel=args.parallel,
+                                          delay_seconds=args.delay)
 
     except Exception as e:
         import traceback
@@ -1,3 +1,14 @@
+"""
+Manual walkthrough of BrowserSession: navigation, history, tabs, DOM build.
+
+The steps run sequentially on Playwright's sync API. BrowserSession (and the
+whole agent stack on top of it) is built on the sync API, which is bound to
+the thread it was created on, so the independent navigations here cannot be
+overlapped with asyncio.gather without porting the session layer to
+playwright.async_api; driving sync Playwright from worker threads is unsafe.
+The wait-dominated steps therefore stay sequential by design.
+"""
+
 import os
 import sys
 
@@ -7,8 +18,7 @@ sys.path.insert(0, PROJECT_ROOT)
 
 from src.browser.browser_context import BrowserSession
 
-if __name__ == "__main__":
-
+def main() -> None:
     bs = BrowserSession()
 
     try:
@@ -71,4 +81,8 @@ if __name__ == "__main__":
     finally:
         print("\n=== 14) Close entire session ===")
         bs.close()
-        print("  → Final session:", bs.get_session())
\ No newline at end of file
+        print("  → Final session:", bs.get_session())
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Test script for the DebugLogger path helpers.
+Covers the safe_name sanitizer and the per-test-case directory/file layout.
+"""
+
+import sys
+import os
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.agent.core_utils.logging_utils import DebugLogger, safe_name
+
+
+def test_safe_name_sanitizes():
+    """Test that unsafe characters are replaced and safe ones kept."""
+    assert safe_name("login form: case #1") == "login_form__case__1"
+    assert safe_name("already-safe_name1") == "already-safe_name1"
+
+
+def test_get_test_case_dir():
+    """Test that a sanitized per-test-case directory is created under the run dir."""
+    logger = DebugLogger()
+    tc_dir = logger.get_test_case_dir("my test/case 1")
+
+    assert tc_dir.is_dir()
+    assert tc_dir.name == safe_name("my test/case 1")
+    assert tc_dir.parent == logger.get_run_dir()
+
+
+def test_get_debug_file_path_uses_test_case_dir():
+    """Test that debug file paths land in the test case folder with the prefix."""
+    logger = DebugLogger()
+    path = logger.get_debug_file_path("agent", debug_file_prefix="my test/case 1")
+
+    assert path.endswith(f"{safe_name('my test/case 1')}_agent_debug.log")
+    assert os.path.dirname(path) == str(logger.get_test_case_dir("my test/case 1"))
+
+
+if __name__ == "__main__":
+    test_safe_name_sanitizes()
+    test_get_test_case_dir()
+    test_get_debug_file_path_uses_test_case_dir()
+    print("\n✓ All logging utils tests passed!")
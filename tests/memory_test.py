@@ -11,7 +11,7 @@ from datetime import datetime
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
-from src.agent.core_utils.memory import EnhancedMemory
+from src.agent.core_utils.memory import EnhancedMemory, _MASKED
 
 
 def test_memory_initialization():
@@ -19,8 +19,8 @@ def test_memory_initialization():
     print("Testing memory initialization...")
     memory = EnhancedMemory()
     
-    assert memory.llm_states == []
-    assert memory.tool_outputs == []
+    assert len(memory.llm_states) == 0
+    assert len(memory.tool_outputs) == 0
     assert memory.session_start_time is not None
     assert memory.debug_file_path is None
     print("✓ Memory initialization test passed")
@@ -475,6 +475,79 @@ def test_memory_methods_with_dummy_data():
 
 
 
+def test_condense_rolls_up_older_history():
+    """Test that condense() summarizes older steps and batches LLM calls."""
+    print("\nTesting memory condensation...")
+
+    class _StubLLM:
+        def __init__(self):
+            self.calls = 0
+
+        def ask(self, prompt):
+            self.calls += 1
+            return "Filled the form and validated two fields."
+
+    memory = EnhancedMemory()
+    llm = _StubLLM()
+
+    # Below the tail nothing happens
+    for i in range(1, 6):
+        memory.save_llm_response(
+            {"current_state": {"evaluation_previous_goal": "Success",
+                               "memory": f"m{i}", "next_goal": f"g{i}"}},
+            i,
+        )
+    assert memory.condense(llm) is False
+    assert llm.calls == 0
+
+    # Past the tail the older steps get rolled up once
+    for i in range(6, 13):
+        memory.save_llm_response(
+            {"current_state": {"evaluation_previous_goal": "Success",
+                               "memory": f"m{i}", "next_goal": f"g{i}"}},
+            i,
+        )
+    assert memory.condense(llm) is True
+    assert llm.calls == 1
+    assert "Session Summary (older steps)" in memory.format_memory_context()
+
+    # One new save is below the batch threshold — the summary is reused
+    memory.save_llm_response(
+        {"current_state": {"evaluation_previous_goal": "Success",
+                           "memory": "m13", "next_goal": "g13"}},
+        13,
+    )
+    assert memory.condense(llm) is False
+    assert llm.calls == 1
+    print("✓ Memory condensation test passed")
+
+
+def test_masking_leaves_caller_dicts_untouched():
+    """Test that observation masking only touches memory-owned copies."""
+    print("\nTesting observation masking isolation...")
+    memory = EnhancedMemory()
+
+    caller_states = []
+    for i in range(1, memory._MASK_WINDOW + 6):
+        response = {
+            "current_state": {
+                "evaluation_previous_goal": "Success",
+                "memory": f"observation for step {i}",
+                "next_goal": f"goal {i}",
+            },
+            "actions": [],
+        }
+        caller_states.append(response["current_state"])
+        memory.save_llm_response(response, i)
+
+    # Entries beyond the window are masked inside memory...
+    assert memory.llm_states[0]["current_state"]["memory"] == _MASKED
+    # ...but the dicts the caller handed in keep their full text
+    for i, state in enumerate(caller_states, 1):
+        assert state["memory"] == f"observation for step {i}"
+    print("✓ Masking isolation test passed")
+
+
 def run_all_tests():
     """Run all memory tests."""
     print("Running EnhancedMemory Tests")
@@ -489,6 +562,8 @@ def run_all_tests():
         test_memory_context_formatting()
         test_export_session_data()
         test_memory_methods_with_dummy_data()
+        test_condense_rolls_up_older_history()
+        test_masking_leaves_caller_dicts_untouched()
         
         print("\n" + "=" * 50)
         print("🎉 All tests passed successfully!")